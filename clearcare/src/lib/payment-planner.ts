@@ -58,31 +58,58 @@ export interface PaymentPlannerResult {
   recommendation: string;
 }
 
+// Federal Poverty Level guidelines for household sizes 1-8, shared and immutable
+const FPL_GUIDELINES: Readonly<Record<number, number>> = Object.freeze({
+  1: 15060,
+  2: 20440,
+  3: 25820,
+  4: 31200,
+  5: 36580,
+  6: 41960,
+  7: 47340,
+  8: 52720
+});
+
+// Add $5,380 for each additional family member
+const FPL_ADDITIONAL_MEMBER = 5380;
+
+// Dense FPL lookup indexed by family size, built once at module load so the
+// per-call path is a single typed-array read instead of a branch plus key lookup
+const FPL_TABLE_MAX_SIZE = 64;
+const FPL_TABLE = new Float64Array(FPL_TABLE_MAX_SIZE + 1);
+for (let size = 1; size <= FPL_TABLE_MAX_SIZE; size++) {
+  FPL_TABLE[size] = size <= 8
+    ? FPL_GUIDELINES[size]
+    : FPL_GUIDELINES[8] + (size - 8) * FPL_ADDITIONAL_MEMBER;
+}
+
 // Keep FPL calculation as it's a standard calculation
 export function calculateFplPercentage(annualIncome: number, familySize: number): number {
-  const FPL_GUIDELINES: Record<number, number> = {
-    1: 15060,
-    2: 20440,
-    3: 25820,
-    4: 31200,
-    5: 36580,
-    6: 41960,
-    7: 47340,
-    8: 52720
-  };
+  // Sizes outside the table (fractional, or above the max) keep the original rules
+  const fplAmount = FPL_TABLE[familySize] || (familySize > 8
+    ? FPL_GUIDELINES[8] + (familySize - 8) * FPL_ADDITIONAL_MEMBER
+    : FPL_TABLE[1]);
 
-  let fplAmount: number;
-  
-  if (familySize > 8) {
-    // Add $5,380 for each additional family member
-    fplAmount = FPL_GUIDELINES[8] + (familySize - 8) * 5380;
-  } else {
-    fplAmount = FPL_GUIDELINES[familySize] || FPL_GUIDELINES[1];
-  }
-  
   return (annualIncome / fplAmount) * 100;
 }
 
+// Batch variant for scoring many households at once (e.g. CSV imports or income sliders)
+export function calculateFplPercentages(
+  annualIncomes: ArrayLike<number>,
+  familySizes: ArrayLike<number>
+): Float64Array {
+  if (annualIncomes.length !== familySizes.length) {
+    throw new Error('annualIncomes and familySizes must have the same length');
+  }
+
+  const result = new Float64Array(annualIncomes.length);
+  for (let i = 0; i < result.length; i++) {
+    result[i] = calculateFplPercentage(annualIncomes[i], familySizes[i]);
+  }
+
+  return result;
+}
+
 // DEPRECATED: Use apiClient.getPaymentOptions() instead
 export function assessFinancialCapacity(
   annualIncome: number,